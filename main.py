@@ -12,6 +12,13 @@ Usage:
 Environment Variables:
     HOST: Server host (default: 0.0.0.0)
     PORT: Server port (default: 8000)
+    WORKERS: Number of worker processes (default: number of CPU cores)
+    SHARED_TAGGER: Set to 1 to load the POS tagger once in a dedicated process
+                   shared by all workers (default: 0)
+    TAGGER_PORT: Local port of the shared POS tagger service (default: 8765)
+    CORS_ORIGINS: Comma-separated list of allowed CORS origins (default: *)
+    STATIC_DEV_MODE: Set to 1 to serve index.html from disk on every request
+                     instead of from memory (default: 0)
 """
 
 import os
@@ -23,25 +30,71 @@ src_path = Path(__file__).parent / "src"
 sys.path.insert(0, str(src_path))
 
 if __name__ == "__main__":
+    import copy
+    import logging.config
+
     import uvicorn
+    from uvicorn.config import LOGGING_CONFIG
+
+    # Uvicorn's logging setup, extended to show INFO messages from the API and
+    # NLP components ("src.*" loggers). Applied here for the shared tagger
+    # service and passed to uvicorn for the worker processes.
+    log_config = copy.deepcopy(LOGGING_CONFIG)
+    log_config["loggers"]["src"] = {
+        "handlers": ["default"],
+        "level": "INFO",
+        "propagate": False,
+    }
+    log_config["loggers"]["__main__"] = log_config["loggers"]["src"]
+    logging.config.dictConfig(log_config)
+    logger = logging.getLogger(__name__)
 
     # Get configuration from environment variables
     host = os.getenv("HOST", "0.0.0.0")
     port = int(os.getenv("PORT", 8000))
+    workers = int(os.getenv("WORKERS", os.cpu_count() or 1))
 
     print("=" * 50)
-    print(f"Starting server at http://{host}:{port}")
+    print(f"Starting server at http://{host}:{port} with {workers} worker(s)")
     print("Press Ctrl+C to stop the server")
     print("=" * 50)
 
-    # Import the app after setting up the path
-    from src.api.main import app
+    # Optionally load the POS tagger once and share it across workers
+    if os.getenv("SHARED_TAGGER", "0") == "1":
+        import multiprocessing
+        import secrets
+
+        from src.core.tagger_service import serve_tagger
+
+        tagger_address = f"127.0.0.1:{os.getenv('TAGGER_PORT', 8765)}"
+        tagger_authkey = secrets.token_bytes(16)
+        tagger_ready = multiprocessing.Event()
+        tagger_process = multiprocessing.Process(
+            target=serve_tagger,
+            args=(tagger_address, tagger_authkey, tagger_ready),
+            daemon=True,
+        )
+        tagger_process.start()
+
+        if tagger_ready.wait(timeout=120):
+            # Worker processes inherit these and connect to the shared service
+            os.environ["VSL_TAGGER_ADDRESS"] = tagger_address
+            os.environ["VSL_TAGGER_AUTHKEY"] = tagger_authkey.hex()
+        else:
+            # Stop the service so it does not keep a model copy loaded
+            tagger_process.terminate()
+            tagger_process.join()
+            logger.error("Shared POS tagger failed to start, using per-worker taggers.")
 
     # Start the server
     uvicorn.run(
-        app,  # Use app object directly
+        "src.api.main:app",  # Import string so each worker process loads the app
         host=host,
         port=port,
-        reload=False,  # Disable reload to avoid import string issues
+        workers=workers,
+        loop="auto",  # uvloop when installed
+        http="auto",  # httptools when installed
+        reload=False,
         log_level="info",
+        log_config=log_config,
     )
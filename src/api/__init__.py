@@ -7,6 +7,17 @@ Contains web API endpoints and data models.
 """
 
 from .main import app
-from .models import AnalysisResponse, SignLanguageResponse, TextRequest
+from .models import (
+    AnalysisResponse,
+    AnalyzeAndConvertResponse,
+    SignLanguageResponse,
+    TextRequest,
+)
 
-__all__ = ["app", "TextRequest", "AnalysisResponse", "SignLanguageResponse"]
+__all__ = [
+    "app",
+    "TextRequest",
+    "AnalysisResponse",
+    "SignLanguageResponse",
+    "AnalyzeAndConvertResponse",
+]
@@ -0,0 +1,139 @@
+"""
+Dynamic Request Batcher
+=======================
+
+This module provides an asyncio-based dynamic batcher used by the API to
+merge concurrent requests into a single call to a batch-capable NLP function.
+
+A request that arrives alone is processed at once. When other requests are
+already queued, they are collected until either `max_batch_size` items are
+waiting or `max_delay` seconds have passed since the first item arrived.
+The whole batch is then processed in one call (off the event loop) and each
+result is handed back to the request that submitted it.
+
+Features:
+- Amortizes per-call NLP overhead across concurrent clients
+- No added latency for lone requests; bounded latency through the
+  `max_delay` window under load
+- Per-request futures for result fan-out
+"""
+
+import asyncio
+from typing import Any, Callable, List, Optional, Sequence
+
+
+class DynamicBatcher:
+    """
+    Collect concurrent inputs and process them together in batches.
+
+    The batch function must accept a list of inputs and return a list of
+    results in the same order. It may return an exception instance in place
+    of a result to fail only the request for that input; an exception raised
+    by the batch function fails every request in the batch.
+    """
+
+    def __init__(
+        self,
+        batch_fn: Callable[[List[Any]], Sequence[Any]],
+        max_batch_size: int = 16,
+        max_delay: float = 0.05,
+    ):
+        """
+        Initialize the batcher.
+
+        Args:
+            batch_fn: Function that processes a list of inputs at once
+            max_batch_size: Maximum number of inputs merged into one call
+            max_delay: Maximum time (seconds) to wait for a batch to fill
+        """
+        self.batch_fn = batch_fn
+        self.max_batch_size = max_batch_size
+        self.max_delay = max_delay
+        self._queue: Optional[asyncio.Queue] = None
+        self._worker_task: Optional[asyncio.Task] = None
+
+    def start(self):
+        """Start the background worker task on the running event loop."""
+        if self._worker_task is None:
+            self._queue = asyncio.Queue()
+            self._worker_task = asyncio.create_task(self._worker())
+
+    async def stop(self):
+        """Stop the background worker task."""
+        if self._worker_task is not None:
+            self._worker_task.cancel()
+            try:
+                await self._worker_task
+            except asyncio.CancelledError:
+                pass
+            self._worker_task = None
+
+    async def process_batched(self, item: Any) -> Any:
+        """
+        Submit a single input and wait for its result.
+
+        Args:
+            item: Input to process
+
+        Returns:
+            The result produced by the batch function for this input
+
+        Raises:
+            Exception: Any error raised by the batch function
+        """
+        if self._worker_task is None:
+            raise RuntimeError("DynamicBatcher is not started")
+
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((item, future))
+        return await future
+
+    async def _collect_batch(self) -> list:
+        """
+        Wait for the first queued input. If more inputs are already queued,
+        keep collecting until the batch is full or the delay window has
+        elapsed; otherwise return the single input right away.
+
+        Returns:
+            List of (input, future) pairs
+        """
+        batch = [await self._queue.get()]
+        if self._queue.empty():
+            return batch
+
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self.max_delay
+
+        while len(batch) < self.max_batch_size:
+            timeout = deadline - loop.time()
+            if timeout <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+            except asyncio.TimeoutError:
+                break
+
+        return batch
+
+    async def _worker(self):
+        """Background loop: collect a batch, process it, fan out the results."""
+        while True:
+            batch = await self._collect_batch()
+            items = [item for item, _ in batch]
+
+            try:
+                # Run the CPU-bound batch function off the event loop
+                results = await asyncio.to_thread(self.batch_fn, items)
+            except Exception as e:
+                for _, future in batch:
+                    if not future.done():
+                        future.set_exception(e)
+                continue
+
+            for (_, future), result in zip(batch, results):
+                if future.done():
+                    continue
+                if isinstance(result, Exception):
+                    future.set_exception(result)
+                else:
+                    future.set_result(result)
@@ -11,20 +11,50 @@ Features:
 - Vietnamese to Sign Language conversion with linguistic accuracy
 - RESTful API with automatic documentation
 - Health monitoring and system information
+- Dynamic batching of concurrent NLP requests
 """
 
+import asyncio
+import hashlib
+import logging
+import os
 import time
+from collections import Counter
 from contextlib import asynccontextmanager
 from pathlib import Path
+from typing import Dict, List, Tuple
 
-from fastapi import FastAPI, HTTPException
+import orjson
+from fastapi import FastAPI, HTTPException, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import FileResponse
+from fastapi.responses import FileResponse, ORJSONResponse, Response
 from fastapi.staticfiles import StaticFiles
 
 from ..core.sign_language_converter import VietnameseSignLanguageConverter
 from ..core.tagger import UndertheSeaPOSTagger
-from .models import AnalysisResponse, SignLanguageResponse, TextRequest
+from ..core.tagger_service import RemoteTagger
+from .batcher import DynamicBatcher
+from .models import (
+    AnalysisResponse,
+    AnalyzeAndConvertResponse,
+    SignLanguageResponse,
+    TextRequest,
+)
+
+logger = logging.getLogger(__name__)
+
+
+def get_pos_tagger():
+    """
+    Get the POS tagger used by this worker process.
+
+    When the shared tagger service is enabled (see main.py), all workers use
+    a client to that single service instead of loading their own model.
+
+    Returns:
+        RemoteTagger or UndertheSeaPOSTagger: The POS tagger instance
+    """
+    return RemoteTagger.get_instance() or UndertheSeaPOSTagger.get_instance()
 
 
 @asynccontextmanager
@@ -33,25 +63,62 @@ async def lifespan(app: FastAPI):
     Application lifespan manager - initializes models on startup.
 
     This function runs before the application starts and after it shuts down.
-    It initializes the singleton instances of our NLP components.
+    It initializes the singleton instances of our NLP components and runs a
+    warmup inference so model loading is not paid by the first request.
+
+    Raises:
+        RuntimeError: If a component fails to initialize (fail-fast startup)
     """
 
     # Initialize singletons - they handle their own initialization
-    tagger = UndertheSeaPOSTagger.get_instance()
+    tagger = get_pos_tagger()
     sign_converter = VietnameseSignLanguageConverter.get_instance()
 
-    # Check if components loaded successfully
+    # Components can only fail to initialize here, so refuse to start
+    # instead of checking them on every request
     if not tagger or not tagger.is_initialized:
-        print("[-] Failed to load POS Tagger.")
+        raise RuntimeError("Failed to load POS Tagger.")
 
     if not sign_converter or not sign_converter.is_initialized:
-        print("[-] Failed to load Sign Language Converter.")
+        raise RuntimeError("Failed to load Sign Language Converter.")
 
-    print("[+] API is ready.")
+    # Warm up components so the first real request runs at steady-state speed
+    try:
+        start_ns = time.perf_counter_ns()
+        warmup_tagged = tagger.tag_sentence("Tôi học.")
+        sign_converter.convert_to_sign_language(
+            warmup_tagged or [("Tôi", "PRON"), ("học", "VERB")]
+        )
+        warmup_time = (time.perf_counter_ns() - start_ns) / 1e9
+        logger.info("Warmup completed in %.2fs", warmup_time)
+    except Exception as e:
+        logger.warning("Warmup failed: %s", e)
+
+    # Cache the HTML interface in memory
+    index_file = static_path / "index.html"
+    if index_file.exists():
+        app.state.index_bytes = index_file.read_bytes()
+        app.state.index_etag = (
+            f'"{hashlib.blake2b(app.state.index_bytes, digest_size=16).hexdigest()}"'
+        )
+
+    # Dynamic batchers merge concurrent requests into a single NLP call
+    app.state.tagger_batcher = DynamicBatcher(
+        tag_batch_timed, max_batch_size=16, max_delay=0.05
+    )
+    app.state.sign_batcher = DynamicBatcher(
+        tag_and_convert_batch, max_batch_size=16, max_delay=0.05
+    )
+    app.state.tagger_batcher.start()
+    app.state.sign_batcher.start()
+
+    logger.info("API is ready.")
     yield
 
     # Cleanup on shutdown
-    print("[!] Shutting down Vietnamese NLP API...")
+    logger.info("Shutting down Vietnamese NLP API...")
+    await app.state.tagger_batcher.stop()
+    await app.state.sign_batcher.stop()
 
 
 # Create FastAPI application instance
@@ -60,61 +127,161 @@ app = FastAPI(
     description="API for Vietnamese text processing and Sign Language conversion",
     version="1.0.0",
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 
 # Configure CORS middleware for cross-origin requests
+# In production, set CORS_ORIGINS to a comma-separated list of exact origins
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["*"],  # In production, specify exact origins
+    allow_origins=[
+        origin.strip()
+        for origin in os.getenv("CORS_ORIGINS", "*").split(",")
+        if origin.strip()
+    ],
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
 )
 
+# Example sentences, serialized once at import
+_EXAMPLES_BYTES = orjson.dumps(
+    {
+        "examples": [
+            "Tôi đang học Công nghệ Thông tin tại Đại học Khoa học Tự nhiên.",
+            "Hôm nay trời đẹp, chúng ta đi dạo công viên nhé.",
+            "Việt Nam là một đất nước xinh đẹp và giàu truyền thống.",
+            "Sinh viên trường Đại học Khoa học Tự Nhiên rất năng động.",
+            "Hà Nội là thủ đô của Việt Nam.",
+        ]
+    }
+)
+
+# Serve index.html from disk on every request (for editing the web interface)
+STATIC_DEV_MODE = os.getenv("STATIC_DEV_MODE", "0") == "1"
+
 # Mount static files directory for serving web interface
 static_path = Path(__file__).parent.parent / "static"
 if static_path.exists():
     app.mount("/static", StaticFiles(directory=str(static_path)), name="static")
 
 
-def validate_text_input(text: str) -> str:
+def build_analysis_statistics(
+    tagged_words: List[Tuple[str, str]], elapsed_ns: int
+) -> Dict:
     """
-    Validate and clean text input from user requests.
+    Build POS tagging statistics for an analysis response.
 
     Args:
-        text: Raw text input from user
+        tagged_words: List of (word, POS_tag) tuples
+        elapsed_ns: Time spent on NLP processing (nanoseconds)
 
     Returns:
-        str: Cleaned text ready for processing
+        Dict: Word count, tag distribution and processing metrics
+    """
+    tag_counts = dict(Counter(tag for _, tag in tagged_words))
 
-    Raises:
-        HTTPException: If text is empty or invalid
+    return {
+        "total_words": len(tagged_words),
+        "unique_tags": len(tag_counts),
+        "processing_time": round(elapsed_ns / 1e9, 2),
+        "words_per_second": (
+            round(len(tagged_words) * 1e9 / elapsed_ns, 1) if elapsed_ns > 0 else 0
+        ),
+        "tag_distribution": tag_counts,
+    }
+
+
+def _tag_batch_with_time(texts: List[str]) -> Tuple[List[List], int]:
     """
-    text = text.strip()
-    if not text:
-        raise HTTPException(status_code=400, detail="Please provide text input!")
-    return text
+    POS-tag a batch of texts and measure the tagging time per text.
 
+    Tagging runs once for the whole batch, so its time is split evenly
+    among the texts.
 
-def check_component_initialization(component, component_name: str):
+    Args:
+        texts: List of cleaned Vietnamese texts
+
+    Returns:
+        Tuple of (tagging results in input order, tagging time per text
+        in nanoseconds)
     """
-    Check if a NLP component is properly initialized.
+    start_ns = time.perf_counter_ns()
+    tagged_batch = get_pos_tagger().tag_batch(texts)
+    return tagged_batch, (time.perf_counter_ns() - start_ns) // len(texts)
+
+
+def tag_batch_timed(texts: List[str]) -> List[Tuple[List, int]]:
+    """
+    POS-tag a batch of texts.
+
+    Batch function used by the POS tagging batcher. The reported time only
+    covers NLP work, not the time a request waited for its batch.
 
     Args:
-        component: The component instance to check
-        component_name: Human-readable name for error messages
+        texts: List of cleaned Vietnamese texts
 
-    Raises:
-        HTTPException: If component is not initialized
+    Returns:
+        List of (pos_tagged_words, elapsed_ns) pairs, one per input text
+    """
+    tagged_batch, tagging_ns = _tag_batch_with_time(texts)
+    return [(tagged_words, tagging_ns) for tagged_words in tagged_batch]
+
+
+def tag_and_convert_batch(texts: List[str]) -> List:
     """
-    if not component.is_initialized:
-        raise HTTPException(status_code=500, detail=f"Error loading {component_name}!")
+    POS-tag and convert a batch of texts to sign language.
+
+    Batch function used by the sign language batcher: tagging runs once for
+    the whole batch, then each tagged sentence is converted. A failed
+    conversion is returned as its exception, so only that text's request
+    fails (see DynamicBatcher).
+
+    Args:
+        texts: List of cleaned Vietnamese texts
+
+    Returns:
+        List of (pos_tagged_words, sign_result, elapsed_ns) tuples or
+        exceptions, one per input text
+    """
+    sign_converter = VietnameseSignLanguageConverter.get_instance()
+    tagged_batch, tagging_ns = _tag_batch_with_time(texts)
+
+    results = []
+    for tagged_words in tagged_batch:
+        start_ns = time.perf_counter_ns()
+        try:
+            sign_result = sign_converter.convert_to_sign_language(tagged_words)
+        except Exception as e:
+            results.append(e)
+            continue
+        elapsed_ns = tagging_ns + time.perf_counter_ns() - start_ns
+        results.append((tagged_words, sign_result, elapsed_ns))
+    return results
 
 
 @app.get("/")
-async def read_root():
-    """Serve the main HTML interface page."""
-    return FileResponse(str(static_path / "index.html"))
+async def read_root(request: Request):
+    """
+    Serve the main HTML interface page.
+
+    The page is read once at startup and served from memory. Clients that
+    already hold the current version receive a 304 response. In development
+    mode (STATIC_DEV_MODE=1) the file is read from disk on every request so
+    edits show up without a restart.
+    """
+    index_bytes = getattr(app.state, "index_bytes", None)
+    if index_bytes is None or STATIC_DEV_MODE:
+        return FileResponse(str(static_path / "index.html"))
+
+    headers = {
+        "Cache-Control": "public, max-age=300",
+        "ETag": app.state.index_etag,
+    }
+    if request.headers.get("if-none-match") == app.state.index_etag:
+        return Response(status_code=304, headers=headers)
+
+    return Response(content=index_bytes, media_type="text/html", headers=headers)
 
 
 @app.post("/api/analyze", response_model=AnalysisResponse)
@@ -132,34 +299,16 @@ async def analyze_text(request: TextRequest):
         AnalysisResponse: Results with POS tags and statistics
     """
     try:
-        text = validate_text_input(request.text)
-        pos_tagger = UndertheSeaPOSTagger.get_instance()
-        check_component_initialization(pos_tagger, "POS Tagger")
-
-        # Measure processing time
-        start_time = time.time()
-        tagged_words = pos_tagger.tag_sentence(text)
-        processing_time = time.time() - start_time
+        text = request.text
 
-        # Calculate statistics
-        tag_counts = {}
-        for _, tag in tagged_words:
-            tag_counts[tag] = tag_counts.get(tag, 0) + 1
+        # POS tagging (batched with other requests), timed without the
+        # time spent waiting for the batch
+        tagged_words, elapsed_ns = await app.state.tagger_batcher.process_batched(text)
 
-        return AnalysisResponse(
+        return AnalysisResponse.model_construct(
             success=True,
             results=tagged_words,
-            statistics={
-                "total_words": len(tagged_words),
-                "unique_tags": len(tag_counts),
-                "processing_time": round(processing_time, 2),
-                "words_per_second": (
-                    round(len(tagged_words) / processing_time, 1)
-                    if processing_time > 0
-                    else 0
-                ),
-                "tag_distribution": tag_counts,
-            },
+            statistics=build_analysis_statistics(tagged_words, elapsed_ns),
         )
 
     except HTTPException:
@@ -184,43 +333,71 @@ async def convert_to_sign_language(request: TextRequest):
         SignLanguageResponse: VSL conversion with detailed analysis
     """
     try:
-        text = validate_text_input(request.text)
+        text = request.text
 
-        # Get singleton instances
-        pos_tagger = UndertheSeaPOSTagger.get_instance()
-        sign_converter = VietnameseSignLanguageConverter.get_instance()
+        # POS tagging + sign language conversion (batched with other
+        # requests), timed without the time spent waiting for the batch
+        pos_tagged_words, sign_result, elapsed_ns = (
+            await app.state.sign_batcher.process_batched(text)
+        )
 
-        # Check initialization
-        check_component_initialization(pos_tagger, "POS Tagger")
-        check_component_initialization(sign_converter, "Sign Language Converter")
+        return SignLanguageResponse.model_construct(
+            success=True,
+            processing_time=round(elapsed_ns / 1e9, 2),
+            original_sentence=sign_result.original_sentence,
+            pos_analysis=pos_tagged_words,
+            sign_language_sequence=sign_result.sign_language_sequence,
+            structure_analysis=sign_result.structure_analysis,
+            pos_structure=sign_result.pos_analysis,
+            word_details=sign_result.word_details,
+        )
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Conversion error: {str(e)}")
+
+
+@app.post("/api/analyze-and-convert", response_model=AnalyzeAndConvertResponse)
+async def analyze_and_convert(request: TextRequest):
+    """
+    Analyze Vietnamese text and convert it to Sign Language in one call.
 
-        # Measure processing time
-        start_time = time.time()
+    The text is POS-tagged once and the same tagged sequence is used for both
+    the analysis statistics and the sign language conversion, so clients that
+    need both results avoid a second request and a second tagging pass.
 
-        # Step 1: POS tagging
-        pos_tagged_words = pos_tagger.tag_sentence(text)
+    Args:
+        request: TextRequest containing the text to process
 
-        # Step 2: Convert to sign language
-        sign_result = sign_converter.convert_to_sign_language(pos_tagged_words)
+    Returns:
+        AnalyzeAndConvertResponse: POS analysis and VSL conversion results
+    """
+    try:
+        text = request.text
 
-        # Add processing time to results
-        processing_time = time.time() - start_time
-        sign_result["structure_analysis"]["processing_time"] = round(processing_time, 2)
+        # POS tagging + sign language conversion (batched with other
+        # requests), timed without the time spent waiting for the batch
+        pos_tagged_words, sign_result, elapsed_ns = (
+            await app.state.sign_batcher.process_batched(text)
+        )
 
-        return SignLanguageResponse(
+        return AnalyzeAndConvertResponse.model_construct(
             success=True,
-            original_sentence=sign_result["original_sentence"],
-            pos_analysis=pos_tagged_words,
-            sign_language_sequence=sign_result["sign_language_sequence"],
-            structure_analysis=sign_result["structure_analysis"],
-            pos_structure=sign_result["pos_analysis"],
-            word_details=sign_result.get("word_details", []),
+            processing_time=round(elapsed_ns / 1e9, 2),
+            results=pos_tagged_words,
+            statistics=build_analysis_statistics(pos_tagged_words, elapsed_ns),
+            original_sentence=sign_result.original_sentence,
+            sign_language_sequence=sign_result.sign_language_sequence,
+            structure_analysis=sign_result.structure_analysis,
+            pos_structure=sign_result.pos_analysis,
+            word_details=sign_result.word_details,
         )
 
     except HTTPException:
         raise
     except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Conversion error: {str(e)}")
+        raise HTTPException(status_code=500, detail=f"Processing error: {str(e)}")
 
 
 @app.get("/api/health")
@@ -231,12 +408,17 @@ async def health_check():
     Returns:
         dict: System health status and component availability
     """
-    pos_tagger = UndertheSeaPOSTagger.get_instance()
+    pos_tagger = get_pos_tagger()
     sign_converter = VietnameseSignLanguageConverter.get_instance()
 
+    # May be a round-trip to the shared tagger service, so keep it off the loop
+    pos_tagger_loaded = pos_tagger is not None and await asyncio.to_thread(
+        getattr, pos_tagger, "is_initialized"
+    )
+
     return {
         "status": "healthy",
-        "pos_tagger_loaded": pos_tagger is not None and pos_tagger.is_initialized,
+        "pos_tagger_loaded": pos_tagger_loaded,
         "sign_converter_loaded": sign_converter is not None
         and sign_converter.is_initialized,
         "version": "2.0.0",
@@ -251,12 +433,13 @@ async def get_sign_dictionary_info():
     Returns detailed information about the VSL converter including
     dictionary size, conversion strategies, and grammar rules.
 
+    The converter computes this information once and reuses it.
+
     Returns:
         dict: Sign language system information
     """
     try:
         sign_converter = VietnameseSignLanguageConverter.get_instance()
-        check_component_initialization(sign_converter, "Sign Language Converter")
         return sign_converter.get_sign_dictionary_info()
     except Exception as e:
         raise HTTPException(
@@ -270,16 +453,13 @@ async def get_examples():
     Get example Vietnamese sentences for testing the API.
 
     Returns:
-        dict: List of example sentences in Vietnamese
+        Response: JSON list of example sentences in Vietnamese
     """
-    examples = [
-        "Tôi đang học Công nghệ Thông tin tại Đại học Khoa học Tự nhiên.",
-        "Hôm nay trời đẹp, chúng ta đi dạo công viên nhé.",
-        "Việt Nam là một đất nước xinh đẹp và giàu truyền thống.",
-        "Sinh viên trường Đại học Khoa học Tự Nhiên rất năng động.",
-        "Hà Nội là thủ đô của Việt Nam.",
-    ]
-    return {"examples": examples}
+    return Response(
+        content=_EXAMPLES_BYTES,
+        media_type="application/json",
+        headers={"Cache-Control": "public, max-age=3600"},
+    )
 
 
 if __name__ == "__main__":
@@ -9,11 +9,12 @@ Models:
 - TextRequest: Input text for processing
 - AnalysisResponse: POS tagging results
 - SignLanguageResponse: Sign language conversion results
+- AnalyzeAndConvertResponse: Combined POS tagging and sign language results
 """
 
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class TextRequest(BaseModel):
@@ -23,10 +24,14 @@ class TextRequest(BaseModel):
     Used by endpoints that process Vietnamese text.
     """
 
-    text: str = Field(..., description="Vietnamese text to process", min_length=1)
+    # Whitespace stripping and the empty check run in pydantic-core, so
+    # blank input is rejected with a 422 before reaching the endpoint
+    model_config = ConfigDict(
+        str_strip_whitespace=True,
+        json_schema_extra={"example": {"text": "Tôi đang học tiếng Việt"}},
+    )
 
-    class Config:
-        json_schema_extra = {"example": {"text": "Tôi đang học tiếng Việt"}}
+    text: str = Field(..., description="Vietnamese text to process", min_length=1)
 
 
 class AnalysisResponse(BaseModel):
@@ -37,15 +42,8 @@ class AnalysisResponse(BaseModel):
     POS tags and statistical information.
     """
 
-    success: bool = Field(..., description="Whether the analysis was successful")
-    results: Optional[List[tuple]] = Field(
-        None, description="List of (word, POS_tag) tuples"
-    )
-    statistics: Optional[Dict] = Field(None, description="Analysis statistics")
-    error: Optional[str] = Field(None, description="Error message if failed")
-
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "success": True,
                 "results": [("Tôi", "PRON"), ("đang", "ADV"), ("học", "VERB")],
@@ -56,6 +54,14 @@ class AnalysisResponse(BaseModel):
                 },
             }
         }
+    )
+
+    success: bool = Field(..., description="Whether the analysis was successful")
+    results: Optional[List[Tuple[str, str]]] = Field(
+        None, description="List of (word, POS_tag) tuples"
+    )
+    statistics: Optional[Dict] = Field(None, description="Analysis statistics")
+    error: Optional[str] = Field(None, description="Error message if failed")
 
 
 class SignLanguageResponse(BaseModel):
@@ -66,11 +72,29 @@ class SignLanguageResponse(BaseModel):
     original text, POS analysis, converted sequence, and detailed analysis.
     """
 
+    model_config = ConfigDict(
+        json_schema_extra={
+            "example": {
+                "success": True,
+                "processing_time": 0.05,
+                "original_sentence": "Tôi đang học tiếng Việt",
+                "pos_analysis": [("Tôi", "PRON"), ("đang", "ADV"), ("học", "VERB")],
+                "sign_language_sequence": ["TÔI", "TIẾNG", "VIỆT", "HỌC"],
+                "structure_analysis": {"word_count": 5, "conversion_applied": True},
+            }
+        }
+    )
+
     success: bool = Field(..., description="Whether the conversion was successful")
+    processing_time: Optional[float] = Field(
+        None, description="Processing time in seconds"
+    )
     original_sentence: Optional[str] = Field(
         None, description="Original Vietnamese sentence"
     )
-    pos_analysis: Optional[List[tuple]] = Field(None, description="POS tagging results")
+    pos_analysis: Optional[List[Tuple[str, str]]] = Field(
+        None, description="POS tagging results"
+    )
     sign_language_sequence: Optional[List[str]] = Field(
         None, description="Sign language word sequence"
     )
@@ -83,13 +107,47 @@ class SignLanguageResponse(BaseModel):
     )
     error: Optional[str] = Field(None, description="Error message if failed")
 
-    class Config:
-        json_schema_extra = {
+
+class AnalyzeAndConvertResponse(BaseModel):
+    """
+    Response model for combined analysis and sign language conversion.
+
+    Contains the POS tagging results and statistics together with the
+    sign language conversion, computed from a single tagging pass.
+    """
+
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "success": True,
-                "original_sentence": "Tôi đang học tiếng Việt",
-                "pos_analysis": [("Tôi", "PRON"), ("đang", "ADV"), ("học", "VERB")],
-                "sign_language_sequence": ["TÔI", "TIẾNG", "VIỆT", "HỌC"],
-                "structure_analysis": {"word_count": 5, "conversion_applied": True},
+                "results": [("Tôi", "PRON"), ("đang", "ADV"), ("học", "VERB")],
+                "statistics": {"total_words": 3, "unique_tags": 3},
+                "original_sentence": "Tôi đang học",
+                "sign_language_sequence": ["Tôi", "học", "đang"],
+                "structure_analysis": {"word_count": 3, "conversion_applied": True},
             }
         }
+    )
+
+    success: bool = Field(..., description="Whether the processing was successful")
+    processing_time: Optional[float] = Field(
+        None, description="Processing time in seconds"
+    )
+    results: Optional[List[Tuple[str, str]]] = Field(
+        None, description="List of (word, POS_tag) tuples"
+    )
+    statistics: Optional[Dict] = Field(None, description="Analysis statistics")
+    original_sentence: Optional[str] = Field(
+        None, description="Original Vietnamese sentence"
+    )
+    sign_language_sequence: Optional[List[str]] = Field(
+        None, description="Sign language word sequence"
+    )
+    structure_analysis: Optional[Dict] = Field(
+        None, description="Conversion structure analysis"
+    )
+    pos_structure: Optional[Dict] = Field(None, description="POS structure breakdown")
+    word_details: Optional[List[Dict]] = Field(
+        None, description="Detailed word-by-word information"
+    )
+    error: Optional[str] = Field(None, description="Error message if failed")
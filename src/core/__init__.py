@@ -8,9 +8,16 @@ and sign language conversion.
 Components:
 - tagger: Vietnamese POS tagging using UndertheSea
 - sign_language_converter: Vietnamese to VSL conversion
+- tagger_service: Shared POS tagger process for multi-worker deployments
 """
 
-from .sign_language_converter import VietnameseSignLanguageConverter
+from .sign_language_converter import ConversionResult, VietnameseSignLanguageConverter
 from .tagger import UndertheSeaPOSTagger
+from .tagger_service import RemoteTagger
 
-__all__ = ["UndertheSeaPOSTagger", "VietnameseSignLanguageConverter"]
+__all__ = [
+    "UndertheSeaPOSTagger",
+    "VietnameseSignLanguageConverter",
+    "ConversionResult",
+    "RemoteTagger",
+]
@@ -17,8 +17,106 @@ Features:
 - Classifier integration for proper VSL representation
 """
 
+import logging
+import os
+import pickle
+import re
+import sys
+from dataclasses import dataclass
+from itertools import chain
 from pathlib import Path
-from typing import Dict, List, Tuple
+from typing import Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Sign language dictionary file and its parsed pickle cache (the cache
+# name is versioned so caches in an older key format are not reused)
+_DICTIONARY_PATH = (
+    Path(__file__).parent.parent / "data" / "sign_language_dictionary.txt"
+)
+_DICTIONARY_CACHE_PATH = _DICTIONARY_PATH.with_suffix(".v2.pkl")
+
+# Grammar reordering strategy for VSL
+_REORDER_STRATEGY = {
+    "word_order": "SOV",  # Subject-Object-Verb
+    "time_first": True,  # Time expressions at beginning
+    "adjective_with_subject": True,  # Adjectives follow subjects
+}
+
+# Basic Vietnamese to VSL mappings used when the dictionary file cannot be loaded
+_FALLBACK_DICTIONARY = {
+    # Pronouns
+    "tôi": "TÔI",
+    "bạn": "BẠN",
+    "họ": "HỌ",
+    "chúng tôi": "CHÚNG-TÔI",
+    "chúng ta": "CHÚNG-TA",
+    # Common verbs
+    "đi": "ĐI",
+    "ăn": "ĂN",
+    "học": "HỌC",
+    "làm": "LÀM",
+    "nói": "NÓI",
+    # Numbers
+    "một": "1",
+    "hai": "2",
+    "ba": "3",
+    "bốn": "4",
+    "năm": "5",
+    # Common words
+    "không": "KHÔNG",
+    "có": "CÓ",
+    "rất": "RẤT",
+    "và": "VÀ",
+}
+
+
+@dataclass
+class ConversionResult:
+    """
+    Result of converting a POS-tagged sentence to Vietnamese Sign Language.
+
+    Attributes:
+        original_sentence: Words of the input sentence joined by spaces
+        sign_language_sequence: Words reordered for VSL (SOV structure)
+        structure_analysis: Analysis report of the conversion
+        pos_analysis: (word, POS_tag) pairs grouped by grammatical category
+        word_details: Per-word dictionary details (empty if not requested)
+        reorder_strategy: Description of the applied reordering
+    """
+
+    # Declared by hand: dataclass(slots=True) requires Python 3.10
+    __slots__ = (
+        "original_sentence",
+        "sign_language_sequence",
+        "structure_analysis",
+        "pos_analysis",
+        "word_details",
+        "reorder_strategy",
+    )
+
+    original_sentence: str
+    sign_language_sequence: List[str]
+    structure_analysis: Dict
+    pos_analysis: Dict
+    word_details: List[Dict]
+    reorder_strategy: str
+
+    def to_dict(self) -> Dict:
+        """
+        Convert the result to a dictionary (e.g. for JSON serialization).
+
+        Returns:
+            Dict with one key per field
+        """
+        return {
+            "original_sentence": self.original_sentence,
+            "sign_language_sequence": self.sign_language_sequence,
+            "structure_analysis": self.structure_analysis,
+            "pos_analysis": self.pos_analysis,
+            "word_details": self.word_details,
+            "reorder_strategy": self.reorder_strategy,
+        }
 
 
 class VietnameseSignLanguageConverter:
@@ -33,58 +131,160 @@ class VietnameseSignLanguageConverter:
     - Reorders to VSL SOV structure
     - Applies sign language specific grammar rules
 
-    Implements Singleton pattern for efficient resource management.
+    Implements Singleton pattern for efficient resource management:
+    use `get_instance()` to share one instance.
     """
 
-    _instance = None
-    _initialized = False
-
-    def __new__(cls):
-        """
-        Singleton pattern implementation.
-
-        Returns:
-            VietnameseSignLanguageConverter: The singleton instance
-        """
-        if cls._instance is None:
-            cls._instance = super(VietnameseSignLanguageConverter, cls).__new__(cls)
-        return cls._instance
+    # Temporal expressions placed at the beginning of VSL sentences
+    _TIME_WORDS = frozenset(
+        {
+            "hôm nay",
+            "ngày mai",
+            "hôm qua",
+            "tuần này",
+            "tháng này",
+            "sáng",
+            "chiều",
+            "tối",
+            "đêm",
+            "bây giờ",
+            "lúc này",
+        }
+    )
+
+    # Matches time expressions in a lowercased sentence, longest phrase first
+    _TIME_PATTERN = re.compile(
+        r"\b(?:"
+        + "|".join(map(re.escape, sorted(_TIME_WORDS, key=len, reverse=True)))
+        + r")\b"
+    )
+
+    # Word categories used to group words by grammatical function,
+    # in their order in VSL sentences (see _reorder_for_sign_language)
+    _CATEGORIES = (
+        "time_expressions",  # Temporal expressions (VSL places time first)
+        "pronouns",  # Pronouns
+        "subjects",  # Subject nouns/pronouns
+        "adjectives",  # Descriptive adjectives (describing subjects)
+        "numbers",  # Numerical expressions
+        "objects",  # Object nouns (before verbs in SOV structure)
+        "verbs",  # Action verbs (last in SOV structure)
+        "adverbs",  # Adverbs/modifiers
+        "prepositions",  # Spatial prepositions
+        "others",  # Other word types
+    )
+    (
+        _TIME_EXPRESSIONS,
+        _PRONOUNS,
+        _SUBJECTS,
+        _ADJECTIVES,
+        _NUMBERS,
+        _OBJECTS,
+        _VERBS,
+        _ADVERBS,
+        _PREPOSITIONS,
+        _OTHERS,
+    ) = range(len(_CATEGORIES))
+
+    # Marker for nouns, which become subjects or objects by position
+    _NOUNS = -1
+
+    # Category index for each POS tag; unlisted tags are others
+    _POS_TO_CATEGORY = {
+        "PRON": _PRONOUNS,
+        "NOUN": _NOUNS,
+        "PROPN": _NOUNS,
+        "VERB": _VERBS,
+        "ADJ": _ADJECTIVES,
+        "ADV": _ADVERBS,
+        "NUM": _NUMBERS,
+        "ADP": _PREPOSITIONS,
+    }
+
+    # POS tags of nouns; with the tags missing from _POS_TO_CATEGORY, these are
+    # the only tags a time expression may have (e.g. "tối" as ADJ means "dark")
+    _NOUN_TAGS = frozenset({"NOUN", "PROPN"})
+
+    # Static description of the reordering, shared by every analysis report
+    _REORDER_SUMMARY = {
+        "original_order": "SVO (Subject-Verb-Object)",
+        "sign_language_order": "SOV (Subject-Object-Verb)",
+        "time_placement": "Beginning of sentence",
+        "adjective_placement": "After subject",
+    }
+
+    __slots__ = (
+        "is_initialized",
+        "reorder_strategy",
+        "_basic_signs",
+        "_phrase_pattern",
+        "_info_cache",
+    )
 
     def __init__(self):
         """
         Initialize the converter with conversion rules and dictionary.
 
-        This method only runs once due to the singleton pattern.
-        It loads the sign language dictionary and sets up grammar rules.
+        It sets up grammar rules; the sign language dictionary is loaded
+        on first use (see basic_signs).
         """
-        # Only initialize once
-        if VietnameseSignLanguageConverter._initialized:
-            return
-
         self.is_initialized = True
-        VietnameseSignLanguageConverter._initialized = True
 
         # Initialize sign language conversion rules and dictionary
         self._init_conversion_rules()
 
-
     def _init_conversion_rules(self):
         """
-        Initialize conversion rules and load sign language dictionary.
+        Initialize conversion rules.
 
         Strategy: DECOMPOSE and REORDER Vietnamese text
         - Vietnamese: SVO (Subject-Verb-Object)
         - Sign Language: SOV (Subject-Object-Verb)
         """
-        # Load sign language dictionary from file
-        self.basic_signs = self._load_dictionary_from_file()
-
         # Grammar reordering strategy for VSL
-        self.reorder_strategy = {
-            "word_order": "SOV",  # Subject-Object-Verb
-            "time_first": True,  # Time expressions at beginning
-            "adjective_with_subject": True,  # Adjectives follow subjects
-        }
+        self.reorder_strategy = _REORDER_STRATEGY
+
+        # Loaded by basic_signs on first use, with the pattern matching the
+        # dictionary's multi-word entries
+        self._basic_signs = None
+        self._phrase_pattern = None
+
+        # Computed by get_sign_dictionary_info on first use
+        self._info_cache = None
+
+    @property
+    def basic_signs(self) -> Dict[str, str]:
+        """
+        Sign language dictionary, loaded from file on first access.
+
+        Returns:
+            Dict[str, str]: Dictionary mapping Vietnamese words to sign representations
+        """
+        if self._basic_signs is None:
+            basic_signs = self._load_dictionary_from_file()
+            self._phrase_pattern = self._compile_phrase_pattern(basic_signs)
+            self._basic_signs = basic_signs
+        return self._basic_signs
+
+    def _compile_phrase_pattern(
+        self, dictionary: Dict[str, str]
+    ) -> Optional[re.Pattern]:
+        """
+        Compile a pattern matching the multi-word entries of a dictionary.
+
+        Args:
+            dictionary: Dictionary mapping Vietnamese words to sign representations
+
+        Returns:
+            Compiled pattern (longest phrase first), or None if the dictionary
+            has no multi-word entries
+        """
+        phrases = sorted(
+            (word for word in dictionary if " " in word), key=len, reverse=True
+        )
+        if not phrases:
+            return None
+        return re.compile(r"\b(?:" + "|".join(map(re.escape, phrases)) + r")\b")
 
     def _load_dictionary_from_file(self) -> Dict[str, str]:
         """
@@ -93,48 +293,94 @@ class VietnameseSignLanguageConverter:
         The dictionary file should contain lines in format:
         vietnamese_word = SIGN_LANGUAGE_WORD
 
+        The parsed dictionary is cached as a pickle file next to the text file.
+        The cache is used as long as it is not older than the text file.
+
         Returns:
             Dict[str, str]: Dictionary mapping Vietnamese words to sign representations
         """
-        dictionary = {}
-        dict_file_path = (
-            Path(__file__).parent.parent / "data" / "sign_language_dictionary.txt"
-        )
+        dict_file_path = _DICTIONARY_PATH
+        cache_path = _DICTIONARY_CACHE_PATH
 
         try:
             if not dict_file_path.exists():
-                print(f"[!] Dictionary file not found: {dict_file_path}")
-                print("[*] Using fallback dictionary...")
+                logger.warning("Dictionary file not found: %s", dict_file_path)
+                logger.info("Using fallback dictionary...")
                 return self._get_fallback_dictionary()
 
-            with open(dict_file_path, "r", encoding="utf-8") as file:
-                for line_num, line in enumerate(file, 1):
-                    line = line.strip()
-
-                    # Skip empty lines and comments
-                    if not line or line.startswith("#"):
-                        continue
-
-                    # Parse line format: vietnamese_word = SIGN_LANGUAGE_WORD
-                    if "=" in line:
-                        try:
-                            vietnamese_word, sign_word = line.split("=", 1)
-                            vietnamese_word = vietnamese_word.strip().lower()
-                            sign_word = sign_word.strip().upper()
+            # Use the cached dictionary if it is up to date
+            if (
+                cache_path.exists()
+                and cache_path.stat().st_mtime >= dict_file_path.stat().st_mtime
+            ):
+                try:
+                    with open(cache_path, "rb") as file:
+                        dictionary = {
+                            sys.intern(word): sys.intern(sign)
+                            for word, sign in pickle.load(file).items()
+                        }
+                    logger.info(
+                        "Loaded %d words from dictionary cache", len(dictionary)
+                    )
+                    return dictionary
+                except Exception as e:
+                    logger.warning("Error reading dictionary cache, reparsing: %s", e)
+
+            dictionary = self._parse_dictionary_file(dict_file_path)
+
+            logger.info("Loaded %d words from dictionary file", len(dictionary))
+
+            # Cache the parsed dictionary for the next startup. Worker processes
+            # may do this at the same time, so each writes its own temporary
+            # file and moves it into place atomically.
+            tmp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+            try:
+                with open(tmp_path, "wb") as file:
+                    pickle.dump(dictionary, file, protocol=5)
+                os.replace(tmp_path, cache_path)
+            except OSError as e:
+                logger.warning("Could not write dictionary cache: %s", e)
 
-                            if vietnamese_word and sign_word:
-                                dictionary[vietnamese_word] = sign_word
-                        except ValueError:
-                            print(f"[!] Error parsing line {line_num}: {line}")
-                            continue
-
-            print(f"[+] Loaded {len(dictionary)} words from dictionary file")
             return dictionary
 
         except Exception as e:
-            print(f"[!] Error loading dictionary file: {e}")
+            logger.error("Error loading dictionary file: %s", e)
             return self._get_fallback_dictionary()
 
+    def _parse_dictionary_file(self, dict_file_path: Path) -> Dict[str, str]:
+        """
+        Parse the dictionary text file.
+
+        The whole file is read at once and parsed with comprehensions.
+        Entries with an empty word or sign are dropped. Underscores in words
+        are stored as spaces, the form the POS tagger gives multi-word
+        tokens in, so lookups need no conversion. Words and signs are
+        interned since they are shared by every lookup and response.
+
+        Args:
+            dict_file_path: Path to the dictionary text file
+
+        Returns:
+            Dict[str, str]: Dictionary mapping Vietnamese words to sign representations
+        """
+        lines = dict_file_path.read_text(encoding="utf-8").splitlines()
+
+        # Parse line format: vietnamese_word = SIGN_LANGUAGE_WORD
+        pairs = [
+            line.split("=", 1)
+            for line in lines
+            if "=" in line and not line.lstrip().startswith("#")
+        ]
+        entries = (
+            (word.strip().lower().replace("_", " "), sign.strip().upper())
+            for word, sign in pairs
+        )
+        return {
+            sys.intern(word): sys.intern(sign)
+            for word, sign in entries
+            if word and sign
+        }
+
     def _get_fallback_dictionary(self) -> Dict[str, str]:
         """
         Fallback dictionary in case file loading fails.
@@ -144,33 +390,11 @@ class VietnameseSignLanguageConverter:
         Returns:
             Dict[str, str]: Basic fallback dictionary
         """
-        return {
-            # Pronouns
-            "tôi": "TÔI",
-            "bạn": "BẠN",
-            "họ": "HỌ",
-            "chúng tôi": "CHÚNG-TÔI",
-            "chúng ta": "CHÚNG-TA",
-            # Common verbs
-            "đi": "ĐI",
-            "ăn": "ĂN",
-            "học": "HỌC",
-            "làm": "LÀM",
-            "nói": "NÓI",
-            # Numbers
-            "một": "1",
-            "hai": "2",
-            "ba": "3",
-            "bốn": "4",
-            "năm": "5",
-            # Common words
-            "không": "KHÔNG",
-            "có": "CÓ",
-            "rất": "RẤT",
-            "và": "VÀ",
-        }
+        return _FALLBACK_DICTIONARY
 
-    def convert_to_sign_language(self, pos_tagged_words: List[Tuple[str, str]]) -> Dict:
+    def convert_to_sign_language(
+        self, pos_tagged_words: List[Tuple[str, str]], include_details: bool = True
+    ) -> ConversionResult:
         """
         Convert Vietnamese text to Sign Language representation.
 
@@ -182,124 +406,212 @@ class VietnameseSignLanguageConverter:
 
         Args:
             pos_tagged_words: List of (word, POS_tag) tuples
+            include_details: Whether to build per-word dictionary details;
+                when False, "word_details" is an empty list
 
         Returns:
-            Dict containing the restructured sign language representation
+            ConversionResult containing the restructured sign language
+            representation
+
+        Raises:
+            RuntimeError: If the converter is not initialized
         """
         if not self.is_initialized:
-            return {"error": "Sign Language Converter is not initialized"}
+            raise RuntimeError("Sign Language Converter is not initialized")
 
-        # STEP 1: CATEGORIZE words by grammatical function
-        categorized_words = self._categorize_words(pos_tagged_words)
+        # STEP 1: CATEGORIZE words by grammatical function and look them up
+        # in the dictionary (single pass over the input)
+        groups, word_details = self._categorize_words(pos_tagged_words, include_details)
+        categorized_words = dict(zip(self._CATEGORIES, groups))
 
         # STEP 2: REORDER according to sign language structure (SOV)
-        reordered_structure = self._reorder_for_sign_language(categorized_words)
-
-        # STEP 3: Generate final sequence (keep original or use dictionary)
-        final_sequence = [word for word, _ in reordered_structure]
-
-        # Create detailed word information
-        word_details = self._create_word_details(pos_tagged_words)
+        # and generate the final sequence (original words)
+        final_sequence = self._reorder_for_sign_language(groups)
 
         # Create analysis report
         analysis = self._create_analysis(
             pos_tagged_words, categorized_words, final_sequence
         )
 
-        return {
-            "original_sentence": " ".join([word for word, _ in pos_tagged_words]),
-            "sign_language_sequence": final_sequence,
-            "structure_analysis": analysis,
-            "pos_analysis": categorized_words,
-            "word_details": word_details,
-            "reorder_strategy": "Vietnamese SVO → Sign Language SOV",
-        }
+        return ConversionResult(
+            original_sentence=" ".join(word for word, _ in pos_tagged_words),
+            sign_language_sequence=final_sequence,
+            structure_analysis=analysis,
+            pos_analysis=categorized_words,
+            word_details=word_details,
+            reorder_strategy="Vietnamese SVO → Sign Language SOV",
+        )
 
-    def _categorize_words(self, pos_tagged_words: List[Tuple[str, str]]) -> Dict:
+    def _categorize_words(
+        self, pos_tagged_words: List[Tuple[str, str]], include_details: bool = True
+    ) -> Tuple[List[List], List[Dict]]:
         """
         Categorize words by grammatical function for VSL conversion.
 
         This is crucial for proper VSL grammar as different word types
-        have different positions in the sentence structure.
+        have different positions in the sentence structure. The same pass
+        also looks each word up in the sign language dictionary.
+
+        Time expressions and multi-word dictionary entries are detected on
+        the whole sentence first, so they are recognized even when they span
+        several tokens.
 
         Args:
             pos_tagged_words: List of (word, POS_tag) tuples
+            include_details: Whether to look words up and build word details
 
         Returns:
-            Dict with categorized words by grammatical function
-        """
-        categories = {
-            "subjects": [],  # Subject nouns/pronouns
-            "objects": [],  # Object nouns
-            "verbs": [],  # Action verbs
-            "adjectives": [],  # Descriptive adjectives
-            "adverbs": [],  # Adverbs/modifiers
-            "numbers": [],  # Numerical expressions
-            "pronouns": [],  # Pronouns
-            "prepositions": [],  # Spatial prepositions
-            "time_expressions": [],  # Temporal expressions
-            "others": [],  # Other word types
-        }
+            Tuple of (list of word groups indexed like _CATEGORIES,
+            list of dictionaries with detailed word information)
+        """
+        # One list per category, indexed like _CATEGORIES
+        groups = [[] for _ in self._CATEGORIES]
+        word_details = []
+        basic_signs = self.basic_signs
 
-        for word, pos in pos_tagged_words:
-            word_lower = word.lower()
+        words_lower = [word.lower() for word, _ in pos_tagged_words]
+        time_positions = self._find_time_expressions(pos_tagged_words, words_lower)
+
+        # Signs of dictionary phrases split into several words (e.g. "đại" + "học")
+        phrase_signs = {}
+        if include_details and self._phrase_pattern is not None:
+            for first, last, phrase in self._find_phrases(
+                self._phrase_pattern, words_lower
+            ):
+                if last > first:
+                    sign = basic_signs[phrase]
+                    phrase_signs.update((i, sign) for i in range(first, last + 1))
+
+        # The first noun seen before any verb is the subject
+        subject_open = True
+
+        for position, tagged_word in enumerate(pos_tagged_words):
+            word, pos = tagged_word
+            word_lower = words_lower[position]
 
             # Categorize based on POS tags and word position
-            if pos == "PRON":
-                categories["pronouns"].append((word, pos))
-            elif pos in ["NOUN", "PROPN"]:
-                # Distinguish subject vs object based on position
-                if len(categories["subjects"]) == 0 and len(categories["verbs"]) == 0:
-                    categories["subjects"].append((word, pos))
-                else:
-                    categories["objects"].append((word, pos))
-            elif pos == "VERB":
-                categories["verbs"].append((word, pos))
-            elif pos == "ADJ":
-                categories["adjectives"].append((word, pos))
-            elif pos == "ADV":
-                categories["adverbs"].append((word, pos))
-            elif pos == "NUM":
-                categories["numbers"].append((word, pos))
-            elif pos == "ADP":
-                categories["prepositions"].append((word, pos))
+            if position in time_positions:
+                category = self._TIME_EXPRESSIONS
             else:
-                # Check for time expressions
-                if self._is_time_expression(word_lower):
-                    categories["time_expressions"].append((word, pos))
+                category = self._POS_TO_CATEGORY.get(pos, self._OTHERS)
+
+            if category == self._NOUNS:
+                # Distinguish subject vs object based on position
+                if subject_open:
+                    category = self._SUBJECTS
+                    subject_open = False
                 else:
-                    categories["others"].append((word, pos))
+                    category = self._OBJECTS
+            elif category == self._VERBS:
+                subject_open = False
+
+            # Groups share the input (word, POS_tag) pairs instead of copies
+            groups[category].append(tagged_word)
 
-        return categories
+            if not include_details:
+                continue
 
-    def _is_time_expression(self, word: str) -> bool:
+            # Look up the word in the sign language dictionary, preferring
+            # a phrase it is part of
+            dictionary_match = phrase_signs.get(position)
+            if dictionary_match is None:
+                dictionary_match = basic_signs.get(word_lower)
+            has_dictionary_definition = dictionary_match is not None
+
+            word_details.append(
+                {
+                    "index": position + 1,
+                    "original_word": word,
+                    "pos_tag": pos,
+                    "has_dictionary_definition": has_dictionary_definition,
+                    "dictionary_action": (
+                        dictionary_match
+                        if has_dictionary_definition
+                        else f"{word.upper()}[{pos}]"
+                    ),
+                    "in_dictionary": has_dictionary_definition,
+                }
+            )
+
+        return groups, word_details
+
+    def _find_time_expressions(
+        self, pos_tagged_words: List[Tuple[str, str]], words_lower: List[str]
+    ) -> set:
         """
-        Check if a word is a time expression.
+        Find the words that belong to a time expression.
+
+        A match of _TIME_PATTERN only counts when all its words are tagged as
+        nouns or with a tag outside _POS_TO_CATEGORY, so other senses of
+        time words stay in their category ("Phòng này tối quá", "tối" = dark).
+        A match right after a noun (other than another time expression)
+        completes that noun phrase ("Buổi" + "tối") and does not count
+        either.
 
         Args:
-            word: Word to check
+            pos_tagged_words: List of (word, POS_tag) tuples
+            words_lower: Lowercased words of the sentence
 
         Returns:
-            bool: True if word represents time
+            Set of positions (0-based) of words in a time expression
         """
-        time_words = {
-            "hôm nay",
-            "ngày mai",
-            "hôm qua",
-            "tuần này",
-            "tháng này",
-            "sáng",
-            "chiều",
-            "tối",
-            "đêm",
-            "bây giờ",
-            "lúc này",
-        }
-        return word in time_words
+        time_positions = set()
+
+        for first, last, _ in self._find_phrases(self._TIME_PATTERN, words_lower):
+            if any(
+                pos in self._POS_TO_CATEGORY and pos not in self._NOUN_TAGS
+                for _, pos in pos_tagged_words[first : last + 1]
+            ):
+                continue
+            if (
+                first > 0
+                and pos_tagged_words[first - 1][1] in self._NOUN_TAGS
+                and first - 1 not in time_positions
+            ):
+                continue
+            time_positions.update(range(first, last + 1))
+
+        return time_positions
+
+    def _find_phrases(
+        self, pattern: re.Pattern, words_lower: List[str]
+    ) -> List[Tuple[int, int, str]]:
+        """
+        Find the phrases matched by a pattern in a tokenized sentence.
+
+        The words are joined back into a sentence and scanned once with the
+        pattern. Only matches that start and end on word boundaries are kept,
+        so phrases split across several tokens (e.g. "ngày" + "mai") are
+        found as well.
+
+        Args:
+            pattern: Compiled pattern of lowercased phrases
+            words_lower: Lowercased words of the sentence
 
-    def _reorder_for_sign_language(
-        self, categorized_words: Dict
-    ) -> List[Tuple[str, str]]:
+        Returns:
+            List of (first, last, phrase) tuples, where first and last are
+            the positions (0-based) of the phrase's first and last words
+        """
+        # Character offsets where each word starts and ends in the sentence
+        starts = {}
+        ends = {}
+        offset = 0
+        for position, word in enumerate(words_lower):
+            starts[offset] = position
+            offset += len(word)
+            ends[offset] = position
+            offset += 1
+
+        phrases = []
+        for match in pattern.finditer(" ".join(words_lower)):
+            first = starts.get(match.start())
+            last = ends.get(match.end())
+            if first is not None and last is not None:
+                phrases.append((first, last, match.group()))
+
+        return phrases
+
+    def _reorder_for_sign_language(self, groups: List[List]) -> List[str]:
         """
         Reorder words according to Vietnamese Sign Language grammar.
 
@@ -319,83 +631,13 @@ class VietnameseSignLanguageConverter:
         8. Other words
 
         Args:
-            categorized_words: Dictionary of categorized words
+            groups: Categorized word groups, indexed like _CATEGORIES
 
         Returns:
-            List of reordered (word, POS_tag) tuples
+            List of reordered words
         """
-        reordered = []
-
-        # 1. Time expressions first (VSL places time at beginning)
-        reordered.extend(categorized_words["time_expressions"])
-
-        # 2. Subjects and pronouns
-        reordered.extend(categorized_words["pronouns"])
-        reordered.extend(categorized_words["subjects"])
-
-        # 3. Adjectives (describing subjects)
-        reordered.extend(categorized_words["adjectives"])
-
-        # 4. Numbers
-        reordered.extend(categorized_words["numbers"])
-
-        # 5. Objects (before verbs in SOV structure)
-        reordered.extend(categorized_words["objects"])
-
-        # 6. Verbs (last in SOV structure)
-        reordered.extend(categorized_words["verbs"])
-
-        # 7. Adverbs and prepositions
-        reordered.extend(categorized_words["adverbs"])
-        reordered.extend(categorized_words["prepositions"])
-
-        # 8. Other words
-        reordered.extend(categorized_words["others"])
-
-        return reordered
-
-    def _create_word_details(
-        self, pos_tagged_words: List[Tuple[str, str]]
-    ) -> List[Dict]:
-        """
-        Create detailed information for each word including dictionary lookup.
-
-        Args:
-            pos_tagged_words: List of (word, POS_tag) tuples
-
-        Returns:
-            List of dictionaries with detailed word information
-        """
-        word_details = []
-
-        for index, (word, pos) in enumerate(pos_tagged_words):
-            word_lower = word.lower()
-            normalized_word = word_lower.replace(" ", "_")
-
-            # Check if word exists in sign language dictionary
-            dictionary_match = None
-            has_dictionary_definition = False
-
-            if normalized_word in self.basic_signs:
-                dictionary_match = self.basic_signs[normalized_word]
-                has_dictionary_definition = True
-
-            word_details.append(
-                {
-                    "index": index + 1,
-                    "original_word": word,
-                    "pos_tag": pos,
-                    "has_dictionary_definition": has_dictionary_definition,
-                    "dictionary_action": (
-                        dictionary_match
-                        if has_dictionary_definition
-                        else f"{word.upper()}[{pos}]"
-                    ),
-                    "in_dictionary": has_dictionary_definition,
-                }
-            )
-
-        return word_details
+        # Groups are already in VSL order
+        return [word for word, _ in chain.from_iterable(groups)]
 
     def _create_analysis(
         self,
@@ -425,12 +667,7 @@ class VietnameseSignLanguageConverter:
                 "time_expressions": len(categorized["time_expressions"]),
                 "others": len(categorized["others"]),
             },
-            "reorder_strategy": {
-                "original_order": "SVO (Subject-Verb-Object)",
-                "sign_language_order": "SOV (Subject-Object-Verb)",
-                "time_placement": "Beginning of sentence",
-                "adjective_placement": "After subject",
-            },
+            "reorder_strategy": self._REORDER_SUMMARY,
             "conversion_applied": True,
         }
 
@@ -441,10 +678,16 @@ class VietnameseSignLanguageConverter:
         Returns detailed information about the converter including
         dictionary size, conversion strategies, and grammar rules.
 
+        The result only depends on the loaded dictionary, so it is computed
+        once and reused.
+
         Returns:
             Dict: Sign language system information
         """
-        return {
+        if self._info_cache is not None:
+            return self._info_cache
+
+        self._info_cache = {
             "conversion_system": "Vietnamese Sign Language (VSL) Converter",
             "total_basic_signs": len(self.basic_signs),
             "conversion_strategies": [
@@ -464,6 +707,7 @@ class VietnameseSignLanguageConverter:
             "reorder_strategy": self.reorder_strategy,
             "note": "System uses dictionary file with POS tag fallback",
         }
+        return self._info_cache
 
     @classmethod
     def get_instance(cls):
@@ -473,7 +717,14 @@ class VietnameseSignLanguageConverter:
         Returns:
             VietnameseSignLanguageConverter: The singleton instance
         """
-        return cls()
+        global _INSTANCE
+        if _INSTANCE is None:
+            _INSTANCE = cls()
+        return _INSTANCE
+
+
+# Singleton instance, created on first use by get_instance()
+_INSTANCE = None
 
 
 # Demo and testing code
@@ -498,15 +749,15 @@ if __name__ == "__main__":
 
     result = converter.convert_to_sign_language(test_pos_tagged)
 
-    print(f"\\nOriginal: {result['original_sentence']}")
-    print(f"Sign Language: {' - '.join(result['sign_language_sequence'])}")
+    print(f"\\nOriginal: {result.original_sentence}")
+    print(f"Sign Language: {' - '.join(result.sign_language_sequence)}")
     print(f"\\nStructure Analysis:")
-    for key, value in result["structure_analysis"].items():
+    for key, value in result.structure_analysis.items():
         print(f"  {key}: {value}")
 
     # Test singleton pattern
     print("\\n=== Singleton Pattern Test ===")
-    converter1 = VietnameseSignLanguageConverter()
+    converter1 = VietnameseSignLanguageConverter.get_instance()
     converter2 = VietnameseSignLanguageConverter.get_instance()
     print(f"converter1 is converter2: {converter1 is converter2}")
     print(f"Same instance ID: {id(converter1) == id(converter2)}")
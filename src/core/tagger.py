@@ -9,14 +9,106 @@ resource management and converts UndertheSea tags to Universal Dependencies form
 Features:
 - Singleton pattern for memory efficiency
 - Automatic tag conversion to UD format
+- LRU cache of tagging results for repeated sentences
 - Error handling and initialization checking
 - Vietnamese language optimization
 """
 
+import logging
+from functools import lru_cache
 from typing import List, Tuple
 
 from underthesea import pos_tag
 
+logger = logging.getLogger(__name__)
+
+# Mapping from UndertheSea tags to Universal Dependencies tags
+_TAG_MAPPING = {
+    # Nouns
+    "N": "NOUN",  # Common noun
+    "Np": "PROPN",  # Proper noun
+    "Ny": "NOUN",  # Noun abbreviation
+    # Verbs
+    "V": "VERB",  # Main verb
+    "Vb": "VERB",  # Be verb
+    "Vu": "AUX",  # Auxiliary verb
+    # Adjectives
+    "A": "ADJ",  # Adjective
+    "Ab": "ADJ",  # Adjective base
+    # Adverbs
+    "R": "ADV",  # Adverb
+    "Rb": "ADV",  # Adverb base
+    # Pronouns
+    "P": "PRON",  # Pronoun
+    "Pp": "PRON",  # Personal pronoun
+    # Prepositions/Adpositions
+    "E": "ADP",  # Preposition
+    "Eb": "ADP",  # Preposition base
+    # Conjunctions
+    "C": "CCONJ",  # Coordinating conjunction
+    "Cc": "CCONJ",  # Coordinating conjunction
+    "Cs": "SCONJ",  # Subordinating conjunction
+    # Determiners
+    "L": "DET",  # Determiner
+    "Lb": "DET",  # Determiner base
+    # Numbers
+    "M": "NUM",  # Number
+    "Mb": "NUM",  # Number base
+    # Punctuation
+    "CH": "PUNCT",  # Punctuation
+    ".": "PUNCT",  # Period
+    ",": "PUNCT",  # Comma
+    "?": "PUNCT",  # Question mark
+    "!": "PUNCT",  # Exclamation mark
+    # Particles
+    "T": "PART",  # Particle
+    "Tb": "PART",  # Particle base
+    # Interjections
+    "I": "INTJ",  # Interjection
+    # Others
+    "X": "X",  # Other/Unknown
+    "Fw": "X",  # Foreign word
+}
+
+
+# Longer sentences are tagged without caching, which bounds the cache's
+# memory use whatever clients send
+_CACHE_MAX_LENGTH = 256
+
+
+def _tag_uncached(sentence: str) -> Tuple[Tuple[str, str], ...]:
+    """
+    Tag a sentence with UndertheSea and convert its tags to UD format.
+
+    Args:
+        sentence: Vietnamese text string to be tagged
+
+    Returns:
+        Tuple of (word, POS_tag) pairs
+    """
+    remap = _TAG_MAPPING.get
+    return tuple((word, remap(tag, "X")) for word, tag in pos_tag(sentence))
+
+
+# Results are memoized so repeated sentences are not tagged again. They are
+# tuples so the cached value cannot be modified by callers.
+_tag_cached = lru_cache(maxsize=4096)(_tag_uncached)
+
+
+def _tag(sentence: str) -> Tuple[Tuple[str, str], ...]:
+    """
+    Tag a sentence, using the cache unless it is longer than _CACHE_MAX_LENGTH.
+
+    Args:
+        sentence: Vietnamese text string to be tagged
+
+    Returns:
+        Tuple of (word, POS_tag) pairs
+    """
+    if len(sentence) > _CACHE_MAX_LENGTH:
+        return _tag_uncached(sentence)
+    return _tag_cached(sentence)
+
 
 class UndertheSeaPOSTagger:
     """
@@ -25,47 +117,42 @@ class UndertheSeaPOSTagger:
     This class provides POS tagging for Vietnamese text using the UndertheSea
     NLP library, which is lightweight and fast for Vietnamese language processing.
 
-    Implements Singleton pattern to ensure only one instance exists and
-    to avoid repeated model loading.
+    Implements Singleton pattern: use `get_instance()` to share one
+    instance and avoid repeated model loading.
     """
 
-    _instance = None
-    _initialized = False
+    __slots__ = ("_initialized",)
 
-    def __new__(cls):
+    def __init__(self):
         """
-        Singleton pattern implementation.
+        Initialize the UndertheSea POS tagger.
 
-        Returns:
-            UndertheSeaPOSTagger: The singleton instance
+        The UndertheSea model is loaded and checked on first use
+        (see is_initialized), so creating the tagger is cheap.
         """
-        if cls._instance is None:
-            cls._instance = super(UndertheSeaPOSTagger, cls).__new__(cls)
-        return cls._instance
+        self._initialized = None
 
-    def __init__(self):
+    @property
+    def is_initialized(self) -> bool:
         """
-        Initialize the UndertheSea POS tagger.
+        Whether UndertheSea works.
 
-        This method only runs once due to the singleton pattern.
-        It tests the pos_tag function to ensure proper initialization.
+        The first access tests the pos_tag function, which loads the model;
+        the result is remembered for later calls.
         """
-        # Only initialize once
-        if UndertheSeaPOSTagger._initialized:
-            return
-
-        try:
-            # Test the pos_tag function to ensure it works
-            test_result = pos_tag("Xin chào")
-            if test_result:
-                self.is_initialized = True
-                UndertheSeaPOSTagger._initialized = True
-            else:
-                self.is_initialized = False
-                print("[-] Failed to initialize UndertheSea POS Tagger.")
-        except Exception as e:
-            print(f"[-] Error initializing UndertheSea: {e}")
-            self.is_initialized = False
+        if self._initialized is None:
+            try:
+                # Test the pos_tag function to ensure it works
+                test_result = pos_tag("Xin chào")
+                if test_result:
+                    self._initialized = True
+                else:
+                    self._initialized = False
+                    logger.error("Failed to initialize UndertheSea POS Tagger.")
+            except Exception as e:
+                logger.error("Error initializing UndertheSea: %s", e)
+                self._initialized = False
+        return self._initialized
 
     def tag_sentence(self, sentence: str) -> List[Tuple[str, str]]:
         """
@@ -79,87 +166,47 @@ class UndertheSeaPOSTagger:
             Example: [('Tôi', 'PRON'), ('đi', 'VERB'), ('học', 'VERB')]
         """
         if not self.is_initialized:
-            print("[-] UndertheSea POS tagger is not initialized.")
+            logger.error("UndertheSea POS tagger is not initialized.")
             return []
 
         try:
-            # Use UndertheSea for POS tagging
-            pos_tags_result = pos_tag(sentence)
-
-            # Convert UndertheSea tags to Universal Dependencies format
-            formatted_tags = []
-            for word, tag in pos_tags_result:
-                ud_tag = self._convert_to_ud_tag(tag)
-                formatted_tags.append((word, ud_tag))
-
-            return formatted_tags
+            # Use UndertheSea for POS tagging (cached for repeated sentences)
+            return list(_tag(sentence))
 
         except Exception as e:
-            print(f"[-] Error during POS tagging: {e}")
+            logger.error("Error during POS tagging: %s", e)
             return []
 
-    def _convert_to_ud_tag(self, underthesea_tag: str) -> str:
+    def tag_batch(self, sentences: List[str]) -> List[List[Tuple[str, str]]]:
         """
-        Convert UndertheSea POS tags to Universal Dependencies tags.
+        Perform POS tagging on a batch of Vietnamese sentences.
 
-        This mapping ensures compatibility with international NLP standards
-        and provides consistent tag formats across different tools.
+        Used by the API's dynamic batcher so that concurrent requests are
+        tagged in a single call. The initialization check is done once for
+        the whole batch; a sentence that fails to tag gets an empty result.
 
         Args:
-            underthesea_tag: POS tag from UndertheSea
+            sentences: List of Vietnamese text strings to be tagged
 
         Returns:
-            Corresponding Universal Dependencies tag
+            List of tagging results, one per input sentence, in the same order
         """
-        # Mapping from UndertheSea tags to UD tags
-        tag_mapping = {
-            # Nouns
-            "N": "NOUN",  # Common noun
-            "Np": "PROPN",  # Proper noun
-            "Ny": "NOUN",  # Noun abbreviation
-            # Verbs
-            "V": "VERB",  # Main verb
-            "Vb": "VERB",  # Be verb
-            "Vu": "AUX",  # Auxiliary verb
-            # Adjectives
-            "A": "ADJ",  # Adjective
-            "Ab": "ADJ",  # Adjective base
-            # Adverbs
-            "R": "ADV",  # Adverb
-            "Rb": "ADV",  # Adverb base
-            # Pronouns
-            "P": "PRON",  # Pronoun
-            "Pp": "PRON",  # Personal pronoun
-            # Prepositions/Adpositions
-            "E": "ADP",  # Preposition
-            "Eb": "ADP",  # Preposition base
-            # Conjunctions
-            "C": "CCONJ",  # Coordinating conjunction
-            "Cc": "CCONJ",  # Coordinating conjunction
-            "Cs": "SCONJ",  # Subordinating conjunction
-            # Determiners
-            "L": "DET",  # Determiner
-            "Lb": "DET",  # Determiner base
-            # Numbers
-            "M": "NUM",  # Number
-            "Mb": "NUM",  # Number base
-            # Punctuation
-            "CH": "PUNCT",  # Punctuation
-            ".": "PUNCT",  # Period
-            ",": "PUNCT",  # Comma
-            "?": "PUNCT",  # Question mark
-            "!": "PUNCT",  # Exclamation mark
-            # Particles
-            "T": "PART",  # Particle
-            "Tb": "PART",  # Particle base
-            # Interjections
-            "I": "INTJ",  # Interjection
-            # Others
-            "X": "X",  # Other/Unknown
-            "Fw": "X",  # Foreign word
-        }
-
-        return tag_mapping.get(underthesea_tag, "X")
+        if not self.is_initialized:
+            logger.error("UndertheSea POS tagger is not initialized.")
+            return [[] for _ in sentences]
+
+        results = []
+        for sentence in sentences:
+            try:
+                results.append(list(_tag(sentence)))
+            except Exception as e:
+                logger.error("Error during POS tagging: %s", e)
+                results.append([])
+        return results
+
+    def clear_cache(self):
+        """Clear the cache of tagged sentences."""
+        _tag_cached.cache_clear()
 
     @classmethod
     def get_instance(cls):
@@ -169,7 +216,14 @@ class UndertheSeaPOSTagger:
         Returns:
             UndertheSeaPOSTagger: The singleton instance
         """
-        return cls()
+        global _INSTANCE
+        if _INSTANCE is None:
+            _INSTANCE = cls()
+        return _INSTANCE
+
+
+# Singleton instance, created on first use by get_instance()
+_INSTANCE = None
 
 
 # Demo and testing code
@@ -194,9 +248,9 @@ if __name__ == "__main__":
 
         # Test singleton pattern
         print("\\n=== Singleton Pattern Test ===")
-        tagger1 = UndertheSeaPOSTagger()
+        tagger1 = UndertheSeaPOSTagger.get_instance()
         tagger2 = UndertheSeaPOSTagger.get_instance()
         print(f"tagger1 is tagger2: {tagger1 is tagger2}")
         print(f"Same instance ID: {id(tagger1) == id(tagger2)}")
     else:
-        print("[-] Failed to initialize UndertheSea tagger")
\ No newline at end of file
+        print("[-] Failed to initialize UndertheSea tagger")
@@ -0,0 +1,252 @@
+"""
+Shared POS Tagger Service
+=========================
+
+This module lets several API worker processes share a single UndertheSea
+POS tagger instead of loading one model per worker.
+
+A dedicated process runs `serve_tagger`, which loads the tagger once and
+answers tagging requests over a local `multiprocessing.connection` socket.
+Worker processes use `RemoteTagger`, which exposes the same tagging methods
+as `UndertheSeaPOSTagger` and forwards calls to the service.
+
+Environment Variables:
+    VSL_TAGGER_ADDRESS: host:port of the tagger service (set by main.py)
+    VSL_TAGGER_AUTHKEY: Hex-encoded authentication key for the service
+"""
+
+import logging
+import os
+import socket
+import struct
+import threading
+from multiprocessing import AuthenticationError
+from multiprocessing.connection import (
+    Client,
+    Listener,
+    answer_challenge,
+    deliver_challenge,
+)
+from typing import List, Optional, Tuple
+
+from .tagger import UndertheSeaPOSTagger
+
+logger = logging.getLogger(__name__)
+
+# Message sent by clients to query the service's initialization status
+_STATUS_REQUEST = None
+
+# Seconds a new client has to complete the authentication handshake
+_HANDSHAKE_TIMEOUT = 5
+
+
+def _parse_address(address: str) -> Tuple[str, int]:
+    """
+    Parse a "host:port" string into a socket address.
+
+    Args:
+        address: Address in "host:port" format
+
+    Returns:
+        Tuple of (host, port)
+    """
+    host, port = address.rsplit(":", 1)
+    return host, int(port)
+
+
+def _set_recv_timeout(conn, seconds: int):
+    """
+    Set the receive timeout of a connection's socket.
+
+    Reads that time out raise an OSError. A timeout of 0 blocks forever.
+
+    Args:
+        conn: Socket-based connection
+        seconds: Receive timeout in seconds
+    """
+    # fromfd works on a duplicate descriptor; the option applies to the
+    # shared socket, so closing the duplicate leaves the connection open
+    with socket.fromfd(conn.fileno(), socket.AF_INET, socket.SOCK_STREAM) as sock:
+        sock.setsockopt(
+            socket.SOL_SOCKET, socket.SO_RCVTIMEO, struct.pack("ll", seconds, 0)
+        )
+
+
+def _handle_connection(tagger: UndertheSeaPOSTagger, conn, authkey: bytes):
+    """
+    Authenticate one client connection, then serve its tagging requests
+    until it closes.
+
+    Each request is either a list of sentences (answered with the list of
+    tagging results) or a status query (answered with `is_initialized`).
+
+    Args:
+        tagger: The loaded POS tagger
+        conn: Accepted client connection
+        authkey: Authentication key the client must present
+    """
+    with conn:
+        # Same handshake as Listener.accept, but here in the connection's
+        # thread and with a timeout, so a bad client only affects itself
+        try:
+            _set_recv_timeout(conn, _HANDSHAKE_TIMEOUT)
+            deliver_challenge(conn, authkey)
+            answer_challenge(conn, authkey)
+            _set_recv_timeout(conn, 0)
+        except (AuthenticationError, EOFError, OSError) as e:
+            logger.warning("Rejected tagger client connection: %r", e)
+            return
+
+        while True:
+            try:
+                message = conn.recv()
+            except EOFError:
+                break
+
+            if message is _STATUS_REQUEST:
+                conn.send(tagger.is_initialized)
+            else:
+                conn.send(tagger.tag_batch(message))
+
+
+def serve_tagger(address: str, authkey: bytes, ready_event=None):
+    """
+    Load the POS tagger once and serve tagging requests forever.
+
+    Intended to run as the target of a dedicated `multiprocessing.Process`.
+
+    Args:
+        address: Address to listen on, in "host:port" format
+        authkey: Authentication key clients must present
+        ready_event: Optional multiprocessing.Event set once the service
+            is accepting connections
+    """
+    tagger = UndertheSeaPOSTagger.get_instance()
+
+    # Load the model before accepting connections
+    if not tagger.is_initialized:
+        logger.error("Shared POS tagger failed to initialize.")
+
+    # No authkey on the listener: clients are authenticated in their own
+    # thread (see _handle_connection) instead of inside accept()
+    with Listener(_parse_address(address)) as listener:
+        logger.info("Shared POS tagger service listening on %s", address)
+        if ready_event is not None:
+            ready_event.set()
+
+        while True:
+            try:
+                conn = listener.accept()
+            except OSError as e:
+                logger.error("Error accepting tagger client connection: %s", e)
+                continue
+            threading.Thread(
+                target=_handle_connection, args=(tagger, conn, authkey), daemon=True
+            ).start()
+
+
+class RemoteTagger:
+    """
+    Client for the shared POS tagger service.
+
+    Provides the same tagging interface as `UndertheSeaPOSTagger` so API
+    code can use either one. One instance (and one connection) exists per
+    worker process; calls are serialized with a lock because a connection
+    must not be used by several threads at once.
+
+    When the service cannot be reached, requests are handled by this
+    process's own `UndertheSeaPOSTagger` instead.
+    """
+
+    _instance = None
+
+    def __init__(self, address: str, authkey: bytes):
+        """
+        Initialize the client. The connection is opened on first use.
+
+        Args:
+            address: Tagger service address in "host:port" format
+            authkey: Authentication key for the service
+        """
+        self.address = address
+        self.authkey = authkey
+        self._conn = None
+        self._lock = threading.Lock()
+
+    def _request(self, message):
+        """
+        Send a message to the service and wait for its reply.
+
+        Args:
+            message: List of sentences or a status request
+
+        Returns:
+            The service's reply
+        """
+        with self._lock:
+            if self._conn is None:
+                self._conn = Client(_parse_address(self.address), authkey=self.authkey)
+            try:
+                self._conn.send(message)
+                return self._conn.recv()
+            except (EOFError, OSError):
+                # Drop the broken connection so the next call reconnects
+                self._conn.close()
+                self._conn = None
+                raise
+
+    @property
+    def is_initialized(self) -> bool:
+        """Whether the shared tagger service (or the local fallback) is initialized."""
+        try:
+            return bool(self._request(_STATUS_REQUEST))
+        except Exception as e:
+            logger.error(
+                "Error contacting shared POS tagger, using local tagger: %s", e
+            )
+            return UndertheSeaPOSTagger.get_instance().is_initialized
+
+    def tag_sentence(self, sentence: str) -> List[Tuple[str, str]]:
+        """
+        Perform POS tagging on a Vietnamese sentence via the shared service.
+
+        Args:
+            sentence: Vietnamese text string to be tagged
+
+        Returns:
+            List of tuples containing (word, POS_tag) pairs
+        """
+        return self.tag_batch([sentence])[0]
+
+    def tag_batch(self, sentences: List[str]) -> List[List[Tuple[str, str]]]:
+        """
+        Perform POS tagging on a batch of sentences via the shared service.
+
+        Args:
+            sentences: List of Vietnamese text strings to be tagged
+
+        Returns:
+            List of tagging results, one per input sentence, in the same order
+        """
+        try:
+            return self._request(list(sentences))
+        except Exception as e:
+            logger.error("Error during remote POS tagging, using local tagger: %s", e)
+            return UndertheSeaPOSTagger.get_instance().tag_batch(sentences)
+
+    @classmethod
+    def get_instance(cls) -> Optional["RemoteTagger"]:
+        """
+        Get this process's client for the shared tagger service.
+
+        Returns:
+            RemoteTagger: The client instance, or None if no service is
+            configured through VSL_TAGGER_ADDRESS
+        """
+        if cls._instance is None:
+            address = os.getenv("VSL_TAGGER_ADDRESS")
+            if not address:
+                return None
+            authkey = bytes.fromhex(os.getenv("VSL_TAGGER_AUTHKEY", ""))
+            cls._instance = cls(address, authkey)
+        return cls._instance
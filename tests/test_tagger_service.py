@@ -0,0 +1,72 @@
+"""
+Tests for the shared POS tagger service.
+
+Run with: python -m unittest discover tests
+"""
+
+import multiprocessing
+import secrets
+import socket
+import unittest
+from multiprocessing import AuthenticationError
+from multiprocessing.connection import Client
+
+from src.core.tagger_service import RemoteTagger, _parse_address, serve_tagger
+
+
+def _free_address() -> str:
+    """Return a local "host:port" address with a currently unused port."""
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return f"127.0.0.1:{sock.getsockname()[1]}"
+
+
+class TaggerServiceTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.address = _free_address()
+        cls.authkey = secrets.token_bytes(16)
+        ready = multiprocessing.Event()
+        cls.process = multiprocessing.Process(
+            target=serve_tagger,
+            args=(cls.address, cls.authkey, ready),
+            daemon=True,
+        )
+        cls.process.start()
+        if not ready.wait(timeout=120):
+            cls.process.terminate()
+            raise RuntimeError("Tagger service did not start")
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.process.terminate()
+        cls.process.join()
+
+    def assert_remote_tagging_works(self):
+        tagger = RemoteTagger(self.address, self.authkey)
+        tagged = tagger.tag_batch(["Tôi đi học"])
+        self.assertTrue(tagged[0])
+        self.assertTrue(self.process.is_alive())
+
+    def test_tag_batch(self):
+        tagger = RemoteTagger(self.address, self.authkey)
+        self.assertTrue(tagger.is_initialized)
+        self.assertEqual(len(tagger.tag_batch(["Tôi đi học", "Xin chào"])), 2)
+
+    def test_closed_connection_does_not_stop_service(self):
+        socket.create_connection(_parse_address(self.address)).close()
+        self.assert_remote_tagging_works()
+
+    def test_wrong_authkey_does_not_stop_service(self):
+        with self.assertRaises(AuthenticationError):
+            Client(_parse_address(self.address), authkey=b"wrong key")
+        self.assert_remote_tagging_works()
+
+    def test_silent_client_does_not_block_others(self):
+        # Connects but never answers the authentication challenge
+        with socket.create_connection(_parse_address(self.address)):
+            self.assert_remote_tagging_works()
+
+
+if __name__ == "__main__":
+    unittest.main()